@@ -50,8 +50,17 @@ const AdminDashboard = ({ apiUrl }) => {
         const response = await axios.get(`${apiUrl}/api/admin/games?per_page=300`)
         setGames(response.data.games)
       } else if (activeTab === 'bookings') {
-        const response = await axios.get(`${apiUrl}/api/admin/bookings`)
-        setBookings(response.data)
+        // The API returns bounded pages; follow X-Next-Cursor until the last one
+        let allBookings = []
+        let cursor = null
+        do {
+          const response = await axios.get(`${apiUrl}/api/admin/bookings`, {
+            params: cursor ? { cursor } : {}
+          })
+          allBookings = allBookings.concat(response.data)
+          cursor = response.headers['x-next-cursor']
+        } while (cursor)
+        setBookings(allBookings)
       }
     } catch (err) {
       setError('Failed to load data')
@@ -16,19 +16,14 @@ const AvailabilityCalendar = ({ gameId, apiUrl, onClose }) => {
           dates.push(d.toISOString().split('T')[0]);
         }
 
-        // Fetch availability for each date in parallel
-        // Note: The backend endpoint accepts a single date query param.
-        // We'll need to call it multiple times or use a range (if backend supports it, but currently it seems single date).
-        // Let's call it for each date.
-        const promises = dates.map(date => 
-            axios.get(`${apiUrl}/api/gaming-area/availability?date=${date}`)
-        );
-        
-        const results = await Promise.all(promises);
-        
-        const data = results.map((res, index) => ({
-            date: dates[index],
-            slots: res.data.available_slots || []
+        // One range request returns remaining capacity per hourly slot for every day
+        const res = await axios.get(`${apiUrl}/api/gaming-area/availability`, {
+          params: { from: dates[0], to: dates[dates.length - 1] }
+        });
+
+        const data = dates.map(date => ({
+            date,
+            freeSlots: (res.data.days[date] || []).filter(remaining => remaining > 0).length
         }));
         setAvailability(data);
 
@@ -58,7 +53,7 @@ const AvailabilityCalendar = ({ gameId, apiUrl, onClose }) => {
                         const dateObj = new Date(day.date);
                         const dayName = dateObj.toLocaleDateString('en-US', { weekday: 'short' });
                         const dateNum = dateObj.getDate();
-                        const availableCount = day.slots.length;
+                        const availableCount = day.freeSlots;
                         
                         return (
                             <div key={day.date} style={{
@@ -68,7 +68,12 @@ const GameDetails = ({ gameId, onClose, apiUrl }) => {
           <div className="game-details">
             <div className="game-details-cover">
               {game.cover_image ? (
-                <img src={game.cover_image} alt={game.title} />
+                <picture>
+                  {game.cover_srcset && (
+                    <source type="image/webp" srcSet={game.cover_srcset} sizes="(max-width: 600px) 100vw, 400px" />
+                  )}
+                  <img src={game.cover_image} alt={game.title} />
+                </picture>
               ) : (
                 <div style={{
                   width: '100%',
@@ -12,6 +12,9 @@ const GameSearch = ({ apiUrl }) => {
       game_types: [],
       styles: []
   });
+
+  // Facet counts for the current filters, e.g. { tags: { Action: 12 }, decades: { '2010s': 40 } }
+  const [facets, setFacets] = useState({});
   
   // Expanded Filter State
   const [filters, setFilters] = useState({
@@ -35,6 +38,8 @@ const GameSearch = ({ apiUrl }) => {
   const [page, setPage] = useState(1)
   const [totalPages, setTotalPages] = useState(1)
   const [selectedGameId, setSelectedGameId] = useState(null)
+  const [suggestions, setSuggestions] = useState([])
+  const [didYouMean, setDidYouMean] = useState([])
 
 
   useEffect(() => {
@@ -49,6 +54,23 @@ const GameSearch = ({ apiUrl }) => {
       fetchGames();
   }, [filters.platform_id, filters.available_only, filters.selectedDecades, filters.selectedGameTypes, filters.selectedStyles])
 
+  // Title autocomplete while typing
+  useEffect(() => {
+    if (!filters.search.trim()) {
+      setSuggestions([])
+      return
+    }
+    const timer = setTimeout(async () => {
+      try {
+        const response = await axios.get(`${apiUrl}/api/games/suggest`, { params: { q: filters.search } })
+        setSuggestions(response.data.suggestions)
+      } catch (err) {
+        setSuggestions([])
+      }
+    }, 150)
+    return () => clearTimeout(timer)
+  }, [apiUrl, filters.search])
+
   const fetchPlatforms = async () => {
     try {
       const response = await axios.get(`${apiUrl}/api/admin/platforms`)
@@ -73,7 +95,8 @@ const GameSearch = ({ apiUrl }) => {
     try {
       const params = new URLSearchParams({
         page,
-        per_page: 20
+        per_page: 20,
+        facets: 'true'
       })
       
       // Simple filters
@@ -89,6 +112,15 @@ const GameSearch = ({ apiUrl }) => {
       const response = await axios.get(`${apiUrl}/api/games/search?${params}`)
       setGames(response.data.games)
       setTotalPages(response.data.pages)
+      setFacets(response.data.facets || {})
+
+      // Nothing matched the exact text: offer typo-tolerant matches instead
+      if (response.data.games.length === 0 && filters.search.trim()) {
+        const fuzzy = await axios.get(`${apiUrl}/api/games/fuzzy`, { params: { q: filters.search, limit: 5 } })
+        setDidYouMean(fuzzy.data.results)
+      } else {
+        setDidYouMean([])
+      }
     } catch (err) {
       setError('Failed to load games. Please try again.')
       console.error('Error fetching games:', err)
@@ -123,7 +155,7 @@ const GameSearch = ({ apiUrl }) => {
 
   const isSelected = (type, value) => filters[type].includes(value);
 
-  const FilterSection = ({ title, sectionKey, items, filterTypeKey }) => (
+  const FilterSection = ({ title, sectionKey, items, filterTypeKey, counts = {} }) => (
       <div style={{marginBottom: '1rem', borderBottom: '1px solid #eee', paddingBottom: '1rem'}}>
           <div 
             onClick={() => toggleSection(sectionKey)}
@@ -158,7 +190,7 @@ const GameSearch = ({ apiUrl }) => {
                             transition: 'all 0.2s'
                         }}
                       >
-                          {item}
+                          {item}{counts[item] !== undefined && ` (${counts[item]})`}
                       </button>
                   ))}
               </div>
@@ -177,9 +209,17 @@ const GameSearch = ({ apiUrl }) => {
               <input
                 type="text"
                 placeholder="Search by Title..."
+                list="title-suggestions"
                 value={filters.search}
                 onChange={(e) => setFilters(prev => ({...prev, search: e.target.value}))}
               />
+              <datalist id="title-suggestions">
+                {suggestions.map(game => (
+                  <option key={game.id} value={game.title}>
+                    {[game.chinese_title, game.platform].filter(Boolean).join(' · ')}
+                  </option>
+                ))}
+              </datalist>
             </div>
 
             <div className="form-group" style={{flex: 1}}>
@@ -217,12 +257,14 @@ const GameSearch = ({ apiUrl }) => {
                 sectionKey="decades" 
                 items={metadata.decades} 
                 filterTypeKey="selectedDecades" 
+                counts={facets.decades}
               />
               <FilterSection 
                 title="🎮 Genres" 
                 sectionKey="gameTypes" 
                 items={metadata.game_types} 
                 filterTypeKey="selectedGameTypes" 
+                counts={facets.tags}
               />
           </div>
 
@@ -232,6 +274,22 @@ const GameSearch = ({ apiUrl }) => {
 
       {error && <div className="error">{error}</div>}
 
+      {!loading && didYouMean.length > 0 && (
+        <div className="card">
+          Did you mean:{' '}
+          {didYouMean.map(game => (
+            <button
+              key={game.id}
+              type="button"
+              onClick={() => setSelectedGameId(game.id)}
+              style={{marginRight: '0.5rem', marginTop: '0.5rem'}}
+            >
+              {game.title}{game.platform ? ` (${game.platform})` : ''}
+            </button>
+          ))}
+        </div>
+      )}
+
       {loading ? (
         <div className="loading">Loading games...</div>
       ) : (
@@ -244,7 +302,12 @@ const GameSearch = ({ apiUrl }) => {
                 onClick={() => setSelectedGameId(game.id)}
               >
                 {game.cover_image ? (
-                  <img src={game.cover_image} alt={game.title} />
+                  <picture>
+                    {game.cover_srcset && (
+                      <source type="image/webp" srcSet={game.cover_srcset} sizes="320px" />
+                    )}
+                    <img src={game.cover_thumb || game.cover_image} alt={game.title} loading="lazy" />
+                  </picture>
                 ) : (
                   <div style={{
                     width: '100%',
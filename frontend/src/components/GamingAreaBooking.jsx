@@ -15,6 +15,7 @@ const GamingAreaBooking = ({ apiUrl }) => {
   const [error, setError] = useState(null)
   const [success, setSuccess] = useState(null)
   const [config, setConfig] = useState(null)
+  const [quota, setQuota] = useState(null)
 
   const [booking, setBooking] = useState({
     booking_date: '',
@@ -74,6 +75,25 @@ const GamingAreaBooking = ({ apiUrl }) => {
   }, [games, selectedGame]);
 
 
+  // Remaining weekly quota for the selected week, once the user has identified themselves
+  useEffect(() => {
+    if (!selectedDate || !(booking.user_email || booking.student_id)) {
+      setQuota(null)
+      return
+    }
+    const timer = setTimeout(async () => {
+      try {
+        const response = await axios.get(`${apiUrl}/api/gaming-area/quota`, {
+          params: { date: selectedDate, user_email: booking.user_email, student_id: booking.student_id }
+        })
+        setQuota(response.data)
+      } catch (err) {
+        setQuota(null)
+      }
+    }, 400)
+    return () => clearTimeout(timer)
+  }, [apiUrl, selectedDate, booking.user_email, booking.student_id, success])
+
   const fetchConfig = async () => {
     try {
       const response = await axios.get(`${apiUrl}/api/config`)
@@ -85,7 +105,7 @@ const GamingAreaBooking = ({ apiUrl }) => {
 
   const fetchGames = async () => {
     try {
-      const response = await axios.get(`${apiUrl}/api/games/search?available_only=true`)
+      const response = await axios.get(`${apiUrl}/api/games/picker`)
       setGames(response.data.games || [])
     } catch (err) {
       console.error('Error fetching games:', err)
@@ -416,6 +436,13 @@ const GamingAreaBooking = ({ apiUrl }) => {
                     />
                   </div>
 
+                  {quota && (
+                    <div className={`alert ${quota.remaining_minutes > 0 ? 'alert-info' : 'alert-error'}`}>
+                      {quota.remaining_minutes / 60}h of your {quota.limit_minutes / 60}h weekly limit left
+                      for {quota.week_start} to {quota.week_end}
+                    </div>
+                  )}
+
                   <div className="form-group">
                     <label>Number of Players</label>
                     <input
@@ -0,0 +1,175 @@
+"""initial schema
+
+The models as they stood when schema management moved from db.create_all() to
+migrations. init_db stamps databases created before then at this revision after
+adding the columns they were missing.
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-17 01:27:07.652545
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def pg_trgm_available():
+    """pg_trgm ships with PostgreSQL's contrib package, which some builds leave out"""
+    context = op.get_context()
+    if context.dialect.name != 'postgresql':
+        return False
+    if context.as_sql:
+        return True
+    return op.get_bind().execute(sa.text(
+        "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"
+    )).first() is not None
+
+
+def upgrade():
+    op.create_table('catalog_state',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('platforms',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_table('slot_occupancy',
+    sa.Column('booking_date', sa.Date(), nullable=False),
+    sa.Column('hour', sa.Integer(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('booking_date', 'hour')
+    )
+    op.create_table('tags',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_table('weekly_usage',
+    sa.Column('identity', sa.String(length=200), nullable=False),
+    sa.Column('iso_week', sa.String(length=8), nullable=False),
+    sa.Column('minutes', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('identity', 'iso_week')
+    )
+    op.create_table('games',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=200), nullable=False),
+    sa.Column('chinese_title', sa.String(length=200), nullable=True),
+    sa.Column('category', sa.String(length=50), nullable=True),
+    sa.Column('platform_id', sa.Integer(), nullable=False),
+    sa.Column('genre', sa.String(length=100), nullable=True),
+    sa.Column('release_year', sa.Integer(), nullable=True),
+    sa.Column('developer', sa.String(length=200), nullable=True),
+    sa.Column('publisher', sa.String(length=200), nullable=True),
+    sa.Column('rating', sa.String(length=10), nullable=True),
+    sa.Column('max_players', sa.Integer(), nullable=True),
+    sa.Column('online_multiplayer', sa.Boolean(), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('cover_image', sa.String(length=500), nullable=True),
+    sa.Column('cover_hash', sa.String(length=64), nullable=True),
+    sa.Column('total_copies', sa.Integer(), nullable=True),
+    sa.Column('available_copies', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['platform_id'], ['platforms.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_games_title'), ['title'], unique=False)
+
+    if pg_trgm_available():
+        # Trigram indexes for ILIKE title search; SQLite searches through games_fts instead
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.create_index('ix_games_title_trgm', 'games', ['title'], unique=False,
+                        postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+        op.create_index('ix_games_chinese_title_trgm', 'games', ['chinese_title'], unique=False,
+                        postgresql_using='gin', postgresql_ops={'chinese_title': 'gin_trgm_ops'})
+
+    op.create_table('game_tags',
+    sa.Column('game_id', sa.Integer(), nullable=False),
+    sa.Column('tag_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['game_id'], ['games.id'], ),
+    sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ),
+    sa.PrimaryKeyConstraint('game_id', 'tag_id')
+    )
+    with op.batch_alter_table('game_tags', schema=None) as batch_op:
+        batch_op.create_index('ix_game_tags_tag_id_game_id', ['tag_id', 'game_id'], unique=False)
+
+    op.create_table('gaming_area_bookings',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_name', sa.String(length=100), nullable=False),
+    sa.Column('user_email', sa.String(length=150), nullable=False),
+    sa.Column('student_id', sa.String(length=50), nullable=True),
+    sa.Column('booking_date', sa.Date(), nullable=False),
+    sa.Column('start_time', sa.Time(), nullable=False),
+    sa.Column('end_time', sa.Time(), nullable=False),
+    sa.Column('game_id', sa.Integer(), nullable=False),
+    sa.Column('number_of_players', sa.Integer(), nullable=True),
+    sa.Column('special_requests', sa.Text(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['game_id'], ['games.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('gaming_area_bookings', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_gaming_area_bookings_booking_date'), ['booking_date'], unique=False)
+        batch_op.create_index('ix_gaming_area_bookings_email_date', ['user_email', 'booking_date'], unique=False)
+        batch_op.create_index('ix_gaming_area_bookings_status_date', ['status', 'booking_date', 'start_time', 'end_time'], unique=False)
+        batch_op.create_index('ix_gaming_area_bookings_student_date', ['student_id', 'booking_date'], unique=False)
+
+    op.create_table('rentals',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('game_id', sa.Integer(), nullable=False),
+    sa.Column('user_name', sa.String(length=100), nullable=False),
+    sa.Column('user_email', sa.String(length=150), nullable=False),
+    sa.Column('rental_date', sa.DateTime(), nullable=True),
+    sa.Column('due_date', sa.DateTime(), nullable=False),
+    sa.Column('return_date', sa.DateTime(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['game_id'], ['games.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('rentals')
+    with op.batch_alter_table('gaming_area_bookings', schema=None) as batch_op:
+        batch_op.drop_index('ix_gaming_area_bookings_student_date')
+        batch_op.drop_index('ix_gaming_area_bookings_status_date')
+        batch_op.drop_index('ix_gaming_area_bookings_email_date')
+        batch_op.drop_index(batch_op.f('ix_gaming_area_bookings_booking_date'))
+
+    op.drop_table('gaming_area_bookings')
+    with op.batch_alter_table('game_tags', schema=None) as batch_op:
+        batch_op.drop_index('ix_game_tags_tag_id_game_id')
+
+    op.drop_table('game_tags')
+    if op.get_context().dialect.name == 'postgresql':
+        op.drop_index('ix_games_chinese_title_trgm', table_name='games', if_exists=True)
+        op.drop_index('ix_games_title_trgm', table_name='games', if_exists=True)
+
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_games_title'))
+
+    op.drop_table('games')
+    op.drop_table('weekly_usage')
+    op.drop_table('tags')
+    op.drop_table('slot_occupancy')
+    op.drop_table('platforms')
+    op.drop_table('catalog_state')
@@ -0,0 +1,45 @@
+"""performance indexes
+
+Indexes for the filters the admin lists, rentals and search apply most often.
+Booking lookups by student_id and user_email are already served by the
+(student_id, booking_date) and (user_email, booking_date) indexes from 0001.
+
+Safe to run on a live database: PostgreSQL builds each index with CREATE INDEX
+CONCURRENTLY (no lock blocking reads or writes), SQLite builds them one at a
+time in their own short transactions instead of one long one.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 01:27:36.107532
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('ix_games_available_copies', 'games', ['available_copies']),
+    ('ix_games_platform_id', 'games', ['platform_id']),
+    ('ix_games_release_year', 'games', ['release_year']),
+    ('ix_rentals_game_id', 'rentals', ['game_id']),
+    ('ix_rentals_status', 'rentals', ['status']),
+]
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, if_not_exists=True,
+                            postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,31 @@
+"""catalog inventory version
+
+Separate counter for rental checkouts/returns, and the time of the last bump
+(served as Last-Modified on catalog reads).
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 01:30:23.776538
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('catalog_state', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('inventory_version', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('catalog_state', schema=None) as batch_op:
+        batch_op.drop_column('updated_at')
+        batch_op.drop_column('inventory_version')
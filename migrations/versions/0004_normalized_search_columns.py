@@ -0,0 +1,72 @@
+"""normalized search columns
+
+search_title and search_chinese_title hold the titles after
+normalize_search_text() (NFKC, casefold, Traditional -> Simplified Chinese,
+punctuation and whitespace collapsed). On PostgreSQL the trigram indexes move
+from the raw titles to these columns, which is what text search now matches.
+
+The columns start out NULL: filling them is left to `flask
+backfill-search-columns` (run by init_db as well), which works in short batches
+rather than one table-wide UPDATE inside the migration.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 01:53:53.213705
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+TRIGRAM_INDEXES = [
+    # (new index, new column, replaced index, replaced column)
+    ('ix_games_search_title_trgm', 'search_title', 'ix_games_title_trgm', 'title'),
+    ('ix_games_search_chinese_title_trgm', 'search_chinese_title', 'ix_games_chinese_title_trgm', 'chinese_title'),
+]
+
+
+def pg_trgm_installed():
+    """0001 only installs pg_trgm where the server has it"""
+    context = op.get_context()
+    if context.dialect.name != 'postgresql':
+        return False
+    if context.as_sql:
+        return True
+    return op.get_bind().execute(sa.text(
+        "SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"
+    )).first() is not None
+
+
+def upgrade():
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('search_title', sa.String(length=400), nullable=True))
+        batch_op.add_column(sa.Column('search_chinese_title', sa.String(length=400), nullable=True))
+
+    if pg_trgm_installed():
+        # CONCURRENTLY cannot run inside a transaction block
+        with op.get_context().autocommit_block():
+            for name, column, old_name, _ in TRIGRAM_INDEXES:
+                op.create_index(name, 'games', [column], unique=False, if_not_exists=True,
+                                postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'},
+                                postgresql_concurrently=True)
+                op.drop_index(old_name, table_name='games', if_exists=True, postgresql_concurrently=True)
+
+
+def downgrade():
+    if pg_trgm_installed():
+        with op.get_context().autocommit_block():
+            for name, _, old_name, old_column in reversed(TRIGRAM_INDEXES):
+                op.create_index(old_name, 'games', [old_column], unique=False, if_not_exists=True,
+                                postgresql_using='gin', postgresql_ops={old_column: 'gin_trgm_ops'},
+                                postgresql_concurrently=True)
+                op.drop_index(name, table_name='games', if_exists=True, postgresql_concurrently=True)
+
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.drop_column('search_chinese_title')
+        batch_op.drop_column('search_title')
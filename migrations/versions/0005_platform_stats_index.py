@@ -0,0 +1,38 @@
+"""platform stats index
+
+(platform_id, available_copies) lets the per-platform game counts and
+available-copy totals on /api/admin/platforms come from an index-only scan.
+It also serves every platform_id filter, so it replaces ix_games_platform_id.
+
+The new index is built before the old one is dropped, with CREATE/DROP INDEX
+CONCURRENTLY on PostgreSQL as in 0002.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 01:58:38.518982
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_games_platform_id_available_copies', 'games', ['platform_id', 'available_copies'],
+                        unique=False, if_not_exists=True, postgresql_concurrently=True)
+        op.drop_index('ix_games_platform_id', table_name='games', if_exists=True, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index('ix_games_platform_id', 'games', ['platform_id'], unique=False, if_not_exists=True,
+                        postgresql_concurrently=True)
+        op.drop_index('ix_games_platform_id_available_copies', table_name='games', if_exists=True,
+                      postgresql_concurrently=True)
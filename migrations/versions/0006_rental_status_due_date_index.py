@@ -0,0 +1,39 @@
+"""rental status due date index
+
+(status, due_date) lets the status sweep find active rentals past their due
+date without scanning rental history. It also serves every status filter, so it
+replaces ix_rentals_status. Completing past bookings is already served by
+ix_gaming_area_bookings_status_date.
+
+The new index is built before the old one is dropped, with CREATE/DROP INDEX
+CONCURRENTLY on PostgreSQL as in 0002.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 02:00:10.134499
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_rentals_status_due_date', 'rentals', ['status', 'due_date'], unique=False,
+                        if_not_exists=True, postgresql_concurrently=True)
+        op.drop_index('ix_rentals_status', table_name='rentals', if_exists=True, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index('ix_rentals_status', 'rentals', ['status'], unique=False, if_not_exists=True,
+                        postgresql_concurrently=True)
+        op.drop_index('ix_rentals_status_due_date', table_name='rentals', if_exists=True,
+                      postgresql_concurrently=True)